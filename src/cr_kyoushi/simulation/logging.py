@@ -10,9 +10,14 @@ from typing import (
     List,
     Mapping,
     MutableMapping,
+    Optional,
     Tuple,
     Union,
 )
+from uuid import (
+    UUID,
+    uuid4,
+)
 
 import structlog
 
@@ -24,8 +29,35 @@ from .config import (
 )
 
 
+class LazyUUID:
+    """Random UUID that is only generated once it is first rendered.
+
+    Can be used for log context values that are bound often, but
+    are only needed if a log event is actually emitted (e.g., per step IDs).
+    """
+
+    __slots__ = ("_uuid",)
+
+    def __init__(self):
+        self._uuid: Optional[UUID] = None
+
+    @property
+    def uuid(self) -> UUID:
+        """The UUID (generated on first access)"""
+        if self._uuid is None:
+            self._uuid = uuid4()
+        return self._uuid
+
+    def __str__(self):
+        return str(self.uuid)
+
+    def __repr__(self):
+        return repr(self.uuid)
+
+
 JSON_ENCODERS = {
     re.Pattern: lambda p: p.pattern,
+    LazyUUID: str,
 }
 
 
@@ -89,6 +121,25 @@ def get_logger() -> structlog.stdlib.BoundLogger:
     return structlog.stdlib.get_logger(LOGGER_NAME)
 
 
+def is_enabled_for(log: Any, level: int) -> bool:
+    """Checks if the given logger would emit log events for the given level.
+
+    Even filtered log calls have to build and process the event dict,
+    so this can be used to skip log calls in frequently executed code.
+
+    Args:
+        log: The logger to check
+        level: The log level to check
+
+    Returns:
+        `True` if the logger is enabled for the level or cannot be checked
+        (e.g., structlog is not configured for the standard library),
+        `False` otherwise.
+    """
+    is_enabled = getattr(log, "isEnabledFor", None)
+    return is_enabled is None or is_enabled(level)
+
+
 def configure_logging(logging_config: LoggingConfig):
     """Configures the logging system based on the passed
     [`LoggingConfig`][cr_kyoushi.simulation.config.LoggingConfig]
@@ -10,8 +10,10 @@ from enum import IntEnum
 from typing import (
     Any,
     Dict,
+    FrozenSet,
     Optional,
     Set,
+    Tuple,
     TypeVar,
     Union,
 )
@@ -108,8 +110,9 @@ class Weekday(IntEnum):
     SUNDAY = 6
 
     @classmethod
-    def lookup(cls):
-        return {v: k for v, k in cls.__members__.items()}
+    def lookup(cls) -> Dict[str, "Weekday"]:
+        # return a copy so callers cannot change the names used for validation
+        return dict(_WEEKDAY_NAMES)
 
     @classmethod
     def __get_validators__(cls):
@@ -133,16 +136,21 @@ class Weekday(IntEnum):
             return val
         # check int weekday input
         if isinstance(val, int):
-            if val in cls.lookup().values():
+            if val in _WEEKDAY_VALUES:
                 return Weekday(val)
             raise ValueError("invalid integer weekday")
         # check str weekday input
         try:
-            return cls.lookup()[val.upper()]
+            return _WEEKDAY_NAMES[val.upper()]
         except KeyError as key_error:
             raise ValueError("invalid string weekday") from key_error
 
 
+# the weekday lookups are static so we only compute them once
+_WEEKDAY_NAMES: Dict[str, Weekday] = dict(Weekday.__members__)
+_WEEKDAY_VALUES: FrozenSet[int] = frozenset(w.value for w in Weekday)
+
+
 class TimePeriod(BaseModel):
     """A time period as defined by a start and end time."""
 
@@ -158,10 +166,14 @@ class TimePeriod(BaseModel):
         Returns:
             bool: `True` if within the time period `False` otherwise
         """
-        if self.start_time <= self.end_time:
-            return self.start_time <= to_check and self.end_time > to_check
-        # start > end means our time period is between two days
-        return self.start_time <= to_check or self.end_time > to_check
+        # For same day periods both bounds must hold (after start and before end).
+        # Since start <= end at least one bound always holds and so
+        # "both hold" is the same as "not exactly one holds".
+        # For over night periods (start > end) only one of the bounds can hold
+        # at a time so we are in the period if exactly one holds.
+        start = self.start_time
+        end = self.end_time
+        return (start <= to_check) ^ (to_check < end) ^ (start <= end)
 
 
 class WeekdayActivePeriod(BaseModel):
@@ -187,7 +199,7 @@ class WeekdayActivePeriod(BaseModel):
         Returns:
             bool: `True` if inside the active period `False` otherwise
         """
-        return Weekday(to_check.weekday()) is self.week_day and (
+        return to_check.weekday() == self.week_day and (
             self.time_period is None or self.time_period.in_period(to_check.time())
         )
 
@@ -223,7 +235,15 @@ class ComplexActivePeriod(BaseModel):
         Returns:
             bool: `True` if inside the active period `False` otherwise
         """
-        return any(period.in_active_period(to_check) for period in self.week_days)
+        weekday = to_check.weekday()
+        # each week day can only have one configuration so
+        # only the period for the given day has to be checked
+        for period in self.week_days:
+            if period.week_day == weekday:
+                return period.time_period is None or period.time_period.in_period(
+                    to_check.time()
+                )
+        return False
 
 
 class SimpleActivePeriod(BaseModel):
@@ -251,7 +271,7 @@ class SimpleActivePeriod(BaseModel):
         Returns:
             bool: `True` if inside the active period `False` otherwise
         """
-        return Weekday(to_check.weekday()) in self.week_days and (
+        return to_check.weekday() in self.week_days and (
             self.time_period is None or self.time_period.in_period(to_check.time())
         )
 
@@ -305,7 +325,9 @@ class ApproximateFloat(BaseModel):
         Returns:
             `Approximate(min=value, max=value)`
         """
-        return ApproximateFloat(min=value, max=value)
+        # min == max is always valid so we can skip the validation
+        value = float(value)
+        return cls.construct(min=value, max=value)
 
     @property
     def value(self) -> float:
@@ -386,6 +408,26 @@ class WorkSchedule(BaseModel):
 
         return False
 
+    def work_period(self, to_check: datetime) -> Optional[Tuple[datetime, datetime]]:
+        """Gets the work period the given datetime is in.
+
+        Args:
+            to_check: The datetime to get the work period for
+
+        Returns:
+            The start and end `datetime` of the work period or
+            `None` if the given datetime is not work time
+        """
+        work_hours = self.work_days.get(to_check.weekday())  # type: ignore
+        if work_hours is None or not work_hours.in_period(to_check.time()):
+            return None
+
+        work_date = to_check.date()
+        return (
+            datetime.combine(work_date, work_hours.start_time, to_check.tzinfo),
+            datetime.combine(work_date, work_hours.end_time, to_check.tzinfo),
+        )
+
     def next_work_start(self, to_check: datetime) -> Optional[datetime]:
         """Gets the next work time, relative to the given datetime.
 
@@ -399,34 +441,27 @@ class WorkSchedule(BaseModel):
             The next work time or `None` if there is no work time
         """
 
-        weekday: Weekday = Weekday(to_check.weekday())
+        weekday = to_check.weekday()
+        work_hours = self.work_days.get(weekday)  # type: ignore
 
-        if (
-            # if the given datetime is a workday
-            self.is_work_day(weekday)
-            and (
-                # and work has not begun yet
-                to_check.time() <= self.work_days[weekday].start_time
-                # or if we are still within work time
-                # we return the given days start time
-                or self.is_work_time(to_check)
-            )
-        ):
-            return datetime.combine(to_check.date(), self.work_days[weekday].start_time)
+        # if the given datetime is a workday and work has not begun yet
+        # or if we are still within work time we return the given days start time
+        # (work hours always start before they end so both cases are before the end)
+        if work_hours is not None and to_check.time() < work_hours.end_time:
+            return datetime.combine(to_check.date(), work_hours.start_time)
 
         # otherwise next work start must be some day after
         # the given day so we check the next 7 days
         # (we might only work once a week)
         for i in range(1, 8):
-            # increment weekday and be sure to start from 0 once we pass sunday (int: 6)
-            weekday = Weekday((weekday + 1) % 7)
-            if self.is_work_day(weekday):
+            # be sure to start from 0 once we pass sunday (int: 6)
+            work_hours = self.work_days.get((weekday + i) % 7)  # type: ignore
+            if work_hours is not None:
                 # add the days till the next work day to the given date
-                next_work: datetime = to_check + timedelta(i)
-                # get the start time for that day
-                start_time = self.work_days[weekday].start_time
-
-                return datetime.combine(next_work.date(), start_time)
+                # and get the start time for that day
+                return datetime.combine(
+                    to_check.date() + timedelta(i), work_hours.start_time
+                )
 
         # if we got here then no workday is set so we will never start
         return None
@@ -1,5 +1,6 @@
 import sys
 
+from functools import lru_cache
 from importlib.util import (
     module_from_spec,
     spec_from_file_location,
@@ -8,6 +9,7 @@ from pathlib import Path
 from typing import (
     Dict,
     List,
+    Tuple,
     Type,
 )
 
@@ -31,19 +33,80 @@ except ImportError:
     )
 
 
+@lru_cache(maxsize=1)
+def _all_factory_eps() -> Tuple[EntryPoint, ...]:
+    """Get all installed sm factory entrypoints.
+
+    Scanning the installed distributions for entrypoints is expensive
+    so the result is cached for the lifetime of the process.
+    (see [`invalidate_plugin_cache`][cr_kyoushi.simulation.plugins.invalidate_plugin_cache])
+    """
+    return tuple(entry_points().get(FACTORY_ENTRYPOINT, []))
+
+
+@lru_cache(maxsize=None)
+def _load_factory_file(plugin_path: Path) -> Type[StatemachineFactory]:
+    """Load the sm factory class from a python file.
+
+    Each plugin file is only executed once per process.
+
+    Args:
+        plugin_path: The resolved path of the plugin file
+
+    Returns:
+        The plugin files `StatemachineFactory` class
+    """
+    # load the plugin file
+    spec = spec_from_file_location(plugin_path.stem, plugin_path)
+    factory_plugin = module_from_spec(spec)
+    sys.modules[plugin_path.stem] = factory_plugin
+    spec.loader.exec_module(factory_plugin)  # type: ignore
+    # get the plugin class (must be name StateMachineFactory)
+    return factory_plugin.StatemachineFactory  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def _load_factory_entrypoint(sm_entrypoint: EntryPoint) -> Type[StatemachineFactory]:
+    """Load the sm factory class referenced by an entrypoint.
+
+    Each entrypoint is only resolved once per process.
+
+    Args:
+        sm_entrypoint: The sm factory entrypoint
+
+    Returns:
+        The class referenced by the entrypoint
+    """
+    return sm_entrypoint.load()
+
+
+def invalidate_plugin_cache() -> None:
+    """Clears the cached sm factory entrypoints and plugin files.
+
+    Call this if plugins were installed, removed or changed during runtime
+    and `get_factories` or `get_factory` should pick up the changes.
+    """
+    _all_factory_eps.cache_clear()
+    _load_factory_file.cache_clear()
+    _load_factory_entrypoint.cache_clear()
+
+
 def get_factories(plugin_config: PluginConfig) -> Dict[str, EntryPoint]:
+    include_names = plugin_config.include_names
+    exclude_names = plugin_config.exclude_names
+
     # all available factories which are also included as per the config
     available_sm_factories: List[EntryPoint] = [
         ep
-        for ep in entry_points().get(FACTORY_ENTRYPOINT, [])
-        if any([pattern.match(ep.name) for pattern in plugin_config.include_names])
+        for ep in _all_factory_eps()
+        if any(pattern.match(ep.name) for pattern in include_names)
     ]
 
     # filter out plugins explicitly excluded
     allowed_sm_factories: Dict[str, EntryPoint] = {
         ep.name: ep
         for ep in available_sm_factories
-        if not any([pattern.match(ep.name) for pattern in plugin_config.exclude_names])
+        if not any(pattern.match(ep.name) for pattern in exclude_names)
     }
 
     return allowed_sm_factories
@@ -58,22 +121,14 @@ def get_factory(
             # check if file exists
             plugin_path = Path(sm_name)
             if plugin_path.exists():
-                # load the plugin file
-                spec = spec_from_file_location(plugin_path.stem, plugin_path)
-                factory_plugin = module_from_spec(spec)
-                sys.modules[plugin_path.stem] = factory_plugin
-                spec.loader.exec_module(factory_plugin)  # type: ignore
-                # get the plugin class (must be name StateMachineFactory)
-                factory_class: Type[
-                    StatemachineFactory
-                ] = factory_plugin.StatemachineFactory  # type: ignore
+                factory_class = _load_factory_file(plugin_path.resolve())
             else:
                 raise StatemachineFactoryLoadError(sm_name)
 
         # try to load from entrypoint
         else:
             sm_entrypoint: EntryPoint = available_sm_factories[sm_name]
-            factory_class = sm_entrypoint.load()
+            factory_class = _load_factory_entrypoint(sm_entrypoint)
 
         if issubclass(factory_class, StatemachineFactory):
             return factory_class()
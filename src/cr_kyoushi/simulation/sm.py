@@ -4,6 +4,8 @@
 This module contains all class and function defintions for creating and defining
 Cyber Range Kyoushi simulation machines.
 """
+import logging
+
 from abc import (
     ABC,
     abstractmethod,
@@ -14,6 +16,7 @@ from typing import (
     Generic,
     List,
     Optional,
+    Tuple,
     Type,
 )
 from uuid import (
@@ -25,7 +28,11 @@ from structlog.stdlib import BoundLogger
 
 from . import errors
 from .config import get_seed
-from .logging import get_logger
+from .logging import (
+    LazyUUID,
+    get_logger,
+    is_enabled_for,
+)
 from .model import (
     Context,
     StatemachineConfig,
@@ -143,18 +150,24 @@ class Statemachine:
             or how [`TransitionExecutionErrors`][cr_kyoushi.simulation.errors.TransitionExecutionError]
             are handled.
         """
-        assert self.current_state is not None
-        assert self.current_transition is not None
+        current_state = self.current_state
+        current_transition = self.current_transition
+        assert current_state is not None
+        assert current_transition is not None
+        # check the log level once to skip building filtered info logs
+        log_info = is_enabled_for(log, logging.INFO)
         try:
-            log.info(
-                "Executing transition %s -> %s",
-                self.current_state,
-                self.current_transition,
-            )
-            self.current_state = self.current_transition.execute(
-                log, self.current_state, self.context
+            if log_info:
+                log.info(
+                    "Executing transition %s -> %s",
+                    current_state,
+                    current_transition,
+                )
+            self.current_state = current_transition.execute(
+                log, current_state, self.context
             )
-            log.info("Moved to new state", new_state=self.current_state)
+            if log_info:
+                log.info("Moved to new state", new_state=self.current_state)
         except errors.TransitionExecutionError as transition_error:
             log.warning("Encountered a transition error: %s", transition_error)
             if transition_error.fallback_state:
@@ -177,26 +190,27 @@ class Statemachine:
             Override or extend this function if you whish to change pre-, post-execution
             and handling of all unexpected errors.
         """
-        assert self.current_state is not None
+        current_state = self.current_state
+        assert current_state is not None
 
         # bind upcoming transition context to logger
         log: BoundLogger = self.log.bind(
-            current_state=self.current_state,
+            current_state=current_state,
             transition=None,
-            transition_id=uuid4(),
+            # the id is only generated if a step log event is emitted
+            transition_id=LazyUUID(),
             target=None,
         )
 
         try:
-            self.current_transition = self.states[self.current_state].next(
-                log, self.context
-            )
+            current_transition = self.states[current_state].next(log, self.context)
+            self.current_transition = current_transition
 
-            if self.current_transition:
+            if current_transition:
                 # bind selected transition and target to logger
                 log = log.bind(
-                    transition=self.current_transition.name,
-                    target=self.current_transition.target,
+                    transition=current_transition.name,
+                    target=current_transition.target,
                 )
 
                 # execute transition
@@ -227,9 +241,12 @@ class Statemachine:
             Override or extends this if you whish to change how your
             state machine does continues execution.
         """
+        # bind the step function once instead of looking it up every iteration
+        execute_step = self.execute_step
+
         # state machine run main loop
         while self.current_state:
-            self.execute_step()
+            execute_step()
 
     def run(self) -> None:
         """Starts the state machine execution.
@@ -300,10 +317,13 @@ class StartEndTimeStatemachine(Statemachine):
         self.__end_time = end_time
 
     def _is_end_time(self) -> bool:
+        # called every step so we use the private attribute
+        # directly instead of going through the property
+        end_time = self.__end_time
         # if no end time was set then this is always false
-        if self.end_time is None:
+        if end_time is None:
             return False
-        return self.end_time <= now()
+        return end_time <= now()
 
     def execute_machine(self):
         """State machine main execution loop.
@@ -313,9 +333,24 @@ class StartEndTimeStatemachine(Statemachine):
          - or the current time is >= `end_time`
 
         """
+        # without an end time the default end time check is always false
+        # so we can use the normal main loop (unless the check was changed
+        # either by a subclass or on the instance itself)
+        if (
+            self.__end_time is None
+            and getattr(self._is_end_time, "__func__", None)
+            is StartEndTimeStatemachine._is_end_time
+        ):
+            super().execute_machine()
+            return
+
+        # bind the loop functions once instead of looking them up every iteration
+        execute_step = self.execute_step
+        is_end_time = self._is_end_time
+
         # state machine run main loop
-        while self.current_state and not self._is_end_time():
-            self.execute_step()
+        while self.current_state and not is_end_time():
+            execute_step()
 
     def run(self):
         """Starts the state machine execution.
@@ -377,14 +412,22 @@ class WorkHoursStatemachine(StartEndTimeStatemachine):
             max_errors=max_errors,
         )
         self.__work_schedule = work_schedule
+        self.__work_period: Optional[Tuple[datetime, datetime]] = None
 
     def _in_work_hours(self) -> bool:
         # if we do not have work hours we work 24/7
         if self.work_schedule is None:
             return True
 
-        # if we have work hours we have to check them
-        return self.work_schedule.is_work_time(now())
+        current_time = now()
+        work_period = self.__work_period
+        # we only have to check the work schedule again
+        # once we are outside of the last work period
+        if work_period is None or not (work_period[0] <= current_time < work_period[1]):
+            work_period = self.work_schedule.work_period(current_time)
+            self.__work_period = work_period
+
+        return work_period is not None
 
     def _pause_work(self):
         """The pause work metho will be called before pausing the SM until the next work time.
@@ -2,10 +2,15 @@ from abc import (
     ABCMeta,
     abstractmethod,
 )
-from itertools import cycle
+from bisect import bisect_right
+from itertools import (
+    accumulate,
+    cycle,
+)
 from typing import (
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Sequence,
@@ -31,6 +36,40 @@ __all__ = [
 ]
 
 
+def _cumulative_weights(weights: Iterable[float]) -> List[float]:
+    """Converts weights into a normalized cumulative distribution.
+
+    Args:
+        weights: The non empty list of weights
+
+    Returns:
+        The cumulative weights scaled so that the last element is `1.0`
+    """
+    cum_weights = list(accumulate(weights))
+    total = cum_weights[-1]
+    return [w / total for w in cum_weights]
+
+
+def _choose(
+    transitions: Sequence[Transition],
+    cum_weights: Sequence[float],
+) -> Transition:
+    """Selects a random transition using the given cumulative weights.
+
+    This draws and searches the same way as `np.random.choice` does so
+    seeded simulations select the same transitions, but without
+    allocating and validating arrays on every call.
+
+    Args:
+        transitions: The transitions to choose from
+        cum_weights: The cumulative weights of the transitions
+
+    Returns:
+        The selected transition
+    """
+    return transitions[bisect_right(cum_weights, np.random.random_sample())]
+
+
 class State(metaclass=ABCMeta):
     """A State contains various transitions to other states"""
 
@@ -40,9 +79,7 @@ class State(metaclass=ABCMeta):
 
         Names must be unique within a state machine.
         """
-        if self._name_prefix is not None:
-            return f"{self._name_prefix}_{self._name}"
-        return self._name
+        return self._full_name
 
     @property
     def name_only(self) -> str:
@@ -60,7 +97,7 @@ class State(metaclass=ABCMeta):
         List of all possible [`transitions`][cr_kyoushi.simulation.transitions.Transition]
         originating from this state
         """
-        return list(self._transitions.values())
+        return list(self._transitions_tuple)
 
     @property
     def transitions_map(self) -> Dict[str, Transition]:
@@ -88,10 +125,19 @@ class State(metaclass=ABCMeta):
         self._name = name
         self._transitions = {t.name: t for t in transitions}
         self._name_prefix: Optional[str] = name_prefix
+        # names do not change so the full name is only composed once
+        self._full_name: str = (
+            f"{name_prefix}_{name}" if name_prefix is not None else name
+        )
 
         if len(self._transitions) < len(transitions):
             raise ValueError("Transition names must be unique")
 
+        # immutable copy for fast access in next() implementations
+        self._transitions_tuple: Tuple[Transition, ...] = tuple(
+            self._transitions.values()
+        )
+
     @abstractmethod
     def next(self, log: BoundLogger, context: Context) -> Optional[Transition]:
         """Selects the next state transition.
@@ -152,12 +198,12 @@ class ChoiceState(State):
     @property
     def yes(self) -> Transition:
         """The transition that is returned when the decision function returns `True`"""
-        return self.transitions[0]
+        return self._transitions_tuple[0]
 
     @property
     def no(self) -> Transition:
         """The transition that is returned when the decision function returns `False`"""
-        return self.transitions[1]
+        return self._transitions_tuple[1]
 
     def __init__(
         self,
@@ -216,7 +262,11 @@ class RoundRobinState(State):
             ValueError: If there are transitions with duplicate names
         """
         super().__init__(name, transitions, name_prefix)
-        self.transition_cycle = cycle(transitions)
+        self.transition_cycle = cycle(self._transitions_tuple)
+
+    def reset(self):
+        """Resets the cycle to start with the first transition again"""
+        self.transition_cycle = cycle(self._transitions_tuple)
 
     def next(self, log: BoundLogger, context: Context) -> Optional[Transition]:
         try:
@@ -261,18 +311,23 @@ class ProbabilisticState(State):
         # verify that given weights and transitions are sound
         self.__verify_weights()
 
+        # prepare the selection data once instead of on every next call
+        self.__cum_weights: List[float] = (
+            _cumulative_weights(weights) if len(weights) > 0 else []
+        )
+
     def __verify_weights(self) -> None:
         # check that lengths match
-        if len(self.transitions) != len(self.weights):
+        if len(self._transitions_tuple) != len(self.weights):
             raise ValueError(
                 f"Size of transitions and weights do not match, \
-                got transitions={len(self.transitions)} and weights={len(self.weights)}"
+                got transitions={len(self._transitions_tuple)} and weights={len(self.weights)}"
             )
         # if we were given an empty transition list
         # then there is nothing more to check
         if len(self.weights) > 0:
             # check that all probs are positive values
-            if any(p < 0 for p in self.weights):
+            if min(self.weights) < 0:
                 raise ValueError("Probabilities cannot be negative!")
             # probabilities must always sum to 1
             if abs(1.0 - sum(self.weights)) > 1e-8:
@@ -282,8 +337,8 @@ class ProbabilisticState(State):
                 )
 
     def next(self, log: BoundLogger, context: Context) -> Optional[Transition]:
-        if len(self.transitions) > 0:
-            return np.random.choice(a=np.array(self.transitions), p=self.weights)
+        if self._transitions_tuple:
+            return _choose(self._transitions_tuple, self.__cum_weights)
         return None
 
 
@@ -327,6 +382,10 @@ class AdaptiveProbabilisticState(ProbabilisticState):
 
         self.__modifiers_org: Tuple[float, ...] = tuple(self.modifiers)
 
+        # the modifiers the cumulative weights were last calculated for
+        self.__cum_modifiers: Optional[Tuple[float, ...]] = None
+        self.__cum_weights: List[float] = []
+
     def adapt_before(self, log: BoundLogger, context: Context):
         """Hook to update the weight modifiers before the transition selection.
 
@@ -353,12 +412,24 @@ class AdaptiveProbabilisticState(ProbabilisticState):
         """Resets the modifiers to their original state"""
         self._modifiers = dict(zip(self.transitions, self.__modifiers_org))
 
+    def __cumulative_weights(self) -> List[float]:
+        # an overridden probabilities property might depend on anything
+        # so we can only cache the weights for the default implementation
+        if type(self).probabilities is not AdaptiveProbabilisticState.probabilities:
+            return _cumulative_weights(self.probabilities)
+
+        # the adapt hooks may change the modifiers in place so we compare
+        # the current values to only recalculate if they actually changed
+        modifiers = tuple(self.modifiers)
+        if modifiers != self.__cum_modifiers:
+            self.__cum_weights = _cumulative_weights(self.probabilities)
+            self.__cum_modifiers = modifiers
+        return self.__cum_weights
+
     def next(self, log: BoundLogger, context: Context) -> Optional[Transition]:
-        if len(self.transitions) > 0:
+        if self._transitions_tuple:
             self.adapt_before(log, context)
-            selected = np.random.choice(
-                a=np.array(self.transitions), p=self.probabilities
-            )
+            selected = _choose(self._transitions_tuple, self.__cumulative_weights())
             self.adapt_after(log, context, selected)
             return selected
         return None
@@ -59,9 +59,7 @@ class Transition:
     @property
     def name(self) -> str:
         """The name of the transition (including the prefix)"""
-        if self._name_prefix is not None:
-            return f"{self._name_prefix}_{self._name}"
-        return self._name
+        return self._full_name
 
     @property
     def name_only(self) -> str:
@@ -106,7 +104,15 @@ class Transition:
         self._transition_function: TransitionFunction = transition_function
         self._name: str = name
         self._name_prefix: Optional[str] = name_prefix
+        # names do not change so the full name is only composed once
+        self._full_name: str = (
+            f"{name_prefix}_{name}" if name_prefix is not None else name
+        )
         self._target: Optional[str] = target
+        # string forms are built on first use since they
+        # are logged for every executed transition
+        self._str: Optional[str] = None
+        self._repr: Optional[str] = None
 
     def execute(
         self,
@@ -145,10 +151,14 @@ class Transition:
         return self.target
 
     def __str__(self):
-        return f"name='{self.name}' -> target={self.target}"
+        if self._str is None:
+            self._str = f"name='{self.name}' -> target={self.target}"
+        return self._str
 
     def __repr__(self):
-        return f"{self.name}(name='{self.name}', target={self.target})"
+        if self._repr is None:
+            self._repr = f"{self.name}(name='{self.name}', target={self.target})"
+        return self._repr
 
 
 def transition(
@@ -228,10 +238,11 @@ class DelayedTransition(Transition):
         """
         super().__init__(transition_function, name, target, name_prefix)
 
-        if isinstance(delay_before, float):
+        # convert any plain number (e.g., int or float) delay
+        if not isinstance(delay_before, ApproximateFloat):
             delay_before = ApproximateFloat.convert(delay_before)
 
-        if isinstance(delay_after, float):
+        if not isinstance(delay_after, ApproximateFloat):
             delay_after = ApproximateFloat.convert(delay_after)
 
         self._delay_before = delay_before
@@ -341,3 +352,12 @@ class NoopTransition(Transition):
             name_prefix: A prefix for the transition name
         """
         super().__init__(noop, name=name, target=target, name_prefix=name_prefix)
+
+    def execute(
+        self,
+        log: BoundLogger,
+        current_state: str,
+        context: Context,
+    ) -> Optional[str]:
+        # the noop function does nothing so we can skip calling it
+        return self._target
@@ -75,8 +75,7 @@ def elements_unique(to_check: List[Any]) -> bool:
     Returns:
         `True` if the list contains no duplicates `False` otherwise.
     """
-    seen = set()
-    return not any(i in seen or seen.add(i) for i in to_check)  # type: ignore
+    return len(set(to_check)) == len(to_check)
 
 
 def normalize_propabilities(
@@ -101,7 +100,7 @@ def normalize_propabilities(
         List[float]: [description]
     """
     # only check when requested
-    if check_positive and any(p < 0 for p in propabilities):
+    if check_positive and len(propabilities) > 0 and min(propabilities) < 0:
         raise ValueError("Propabilities must be positive numbers")
 
     total = sum(propabilities)
@@ -143,7 +142,8 @@ def calculate_propabilities(
     if abs(1.0 - sum(weights)) > 1e-8:
         raise ValueError("The weights must sum up to 1")
 
-    if any(w < 0 for w in weights) or any(m < 0 for m in modifiers):
+    # weights are not empty here since they sum up to 1
+    if min(weights) < 0 or min(modifiers) < 0:
         raise ValueError("Weights and modifiers must be positive values")
 
     return normalize_propabilities(
@@ -237,6 +237,11 @@ def sleep(sleep_time: Union[ApproximateFloat, float]) -> None:
     if isinstance(sleep_time, ApproximateFloat):
         sleep_time = sleep_time.value
 
+    # zero delays are common for delayed transitions and there is
+    # nothing to skip so we do not have to setup the signal handler
+    if sleep_time == 0:
+        return
+
     with skip_on_interrupt():
         log.debug("Going to sleep for %f", sleep_time)
         time.sleep(sleep_time)
@@ -113,6 +113,10 @@ def test_load_empty_config_file():
             Path(f"{FILE_DIR}/invalid_plugin_include_names.yml"),
             id="exclude-names",
         ),
+        pytest.param(
+            Path(f"{FILE_DIR}/invalid_plugin_regex.yml"),
+            id="invalid-regex",
+        ),
     ],
 )
 def test_load_invalid_settings(config_path):
@@ -1,4 +1,5 @@
 import os
+import re
 
 from typing import List
 
@@ -68,6 +69,8 @@ def mock_entry_points(mocker: MockFixture) -> List[EntryPoint]:
 def __patch_entry_points(mocker: MockFixture, eps: List[EntryPoint]):
     entry_points = mocker.patch("cr_kyoushi.simulation.plugins.entry_points")
     entry_points.return_value = {FACTORY_ENTRYPOINT: eps}
+    # clear cached entrypoints so the patched function is used
+    plugins.invalidate_plugin_cache()
     return entry_points
 
 
@@ -179,6 +182,59 @@ def test_get_factories_include_and_exclude(
     assert mock_entry_points[0] == factory_eps["test"]
 
 
+@pytest.mark.parametrize(
+    "include_names, expected",
+    [
+        pytest.param(
+            [r"(?i)TEST$", r"example.*"],
+            {"test", "example", "example_2", "example_3"},
+            id="inline-flags",
+        ),
+        pytest.param(
+            [r"(?P<n>test)$", r"(?P<n>example)$"],
+            {"test", "example"},
+            id="same-group-names",
+        ),
+        pytest.param(
+            [r"(x)\1", r"exampl(e)_\d"],
+            {"example_2", "example_3"},
+            id="back-references",
+        ),
+        pytest.param(
+            [re.compile(r"test_.*")],
+            {"test_2", "test_3"},
+            id="compiled-pattern",
+        ),
+    ],
+)
+def test_get_factories_matches_patterns_separately(
+    include_names,
+    expected,
+    mocker: MockFixture,
+    mock_entry_points: List[EntryPoint],
+):
+    __patch_entry_points(mocker, mock_entry_points)
+
+    factory_eps = plugins.get_factories(PluginConfig(include_names=include_names))
+
+    assert set(factory_eps.keys()) == expected
+
+
+def test_get_factories_caches_entry_points(
+    mocker: MockFixture, mock_entry_points: List[EntryPoint]
+):
+    entry_points = __patch_entry_points(mocker, mock_entry_points)
+
+    plugins.get_factories(PluginConfig())
+    plugins.get_factories(PluginConfig(include_names=[r"test.*"]))
+    assert entry_points.call_count == 1
+
+    # invalidating the cache forces a re-scan
+    plugins.invalidate_plugin_cache()
+    plugins.get_factories(PluginConfig())
+    assert entry_points.call_count == 2
+
+
 def test_get_factory_with_valid_ep(mocker: MockFixture):
     class TestFactory(StatemachineFactory):
         @property
@@ -204,6 +260,34 @@ def test_get_factory_with_valid_ep(mocker: MockFixture):
     assert isinstance(test_factory, TestFactory)
 
 
+def test_get_factory_loads_ep_only_once(mocker: MockFixture):
+    class TestFactory(StatemachineFactory):
+        @property
+        def name(self) -> str:
+            return "TestFactory"
+
+        @property
+        def config_class(self):
+            pass
+
+        def build(self, config):
+            pass
+
+    ep_test = mocker.Mock(EntryPoint)
+    ep_test.name = "test"
+    ep_test.load.return_value = TestFactory
+
+    factory_eps = {"test": ep_test}
+
+    test_factory = plugins.get_factory(factory_eps, "test")
+    test_factory_again = plugins.get_factory(factory_eps, "test")
+
+    assert ep_test.load.call_count == 1
+    assert isinstance(test_factory, TestFactory)
+    assert isinstance(test_factory_again, TestFactory)
+    assert test_factory is not test_factory_again
+
+
 def test_get_factory_with_invalid_ep(mocker: MockFixture):
     class InvalidTestFactory:
         pass
@@ -274,6 +358,21 @@ def test_load_plugin_from_file():
     assert len(machine.states["end"].transitions) == 0
 
 
+def test_load_plugin_from_file_only_once():
+    plugins.invalidate_plugin_cache()
+    factory = plugins.get_factory({}, FILE_DIR + "/conftest.py")
+    factory_again = plugins.get_factory({}, FILE_DIR + "/conftest.py")
+
+    # new factory instances, but the plugin file was only loaded once
+    assert factory is not factory_again
+    assert type(factory) is type(factory_again)
+
+    # invalidating the cache reloads the plugin file
+    plugins.invalidate_plugin_cache()
+    factory_reloaded = plugins.get_factory({}, FILE_DIR + "/conftest.py")
+    assert type(factory) is not type(factory_reloaded)
+
+
 def test_load_plugin_from_non_existent_file():
     with pytest.raises(errors.StatemachineFactoryLoadError):
         plugins.get_factory({}, FILE_DIR + "/DOES_NOT_EXIST.py")
@@ -1,6 +1,8 @@
+import json
 import tempfile
 
 from pathlib import Path
+from uuid import UUID
 
 import pytest
 import structlog
@@ -13,8 +15,11 @@ from cr_kyoushi.simulation.config import (
 )
 from cr_kyoushi.simulation.logging import (
     LOGGER_NAME,
+    LazyUUID,
     configure_logging,
+    encoder,
     get_logger,
+    is_enabled_for,
     rename_event_key_wrapper,
 )
 from cr_kyoushi.simulation.model import LogLevel
@@ -137,3 +142,36 @@ def test_handler_config(
             assert handler.formatter.processor._styles == structlog.dev._ColorfulStyles
         if file.format == LogFormat.PLAIN:
             assert handler.formatter.processor._styles == structlog.dev._PlainStyles
+
+
+def test_lazy_uuid_generated_on_first_render():
+    lazy_uuid = LazyUUID()
+    assert lazy_uuid._uuid is None
+
+    rendered = str(lazy_uuid)
+    assert isinstance(lazy_uuid._uuid, UUID)
+    # value must stay stable once generated
+    assert rendered == str(lazy_uuid.uuid)
+    assert repr(lazy_uuid) == repr(lazy_uuid.uuid)
+    assert json.dumps({"id": lazy_uuid}, default=encoder) == f'{{"id": "{rendered}"}}'
+
+
+@pytest.mark.parametrize(
+    "level, check_level, expected",
+    [
+        pytest.param(LogLevel.WARNING, LogLevel.INFO, False, id="filtered"),
+        pytest.param(LogLevel.WARNING, LogLevel.ERROR, True, id="enabled"),
+        pytest.param(LogLevel.INFO, LogLevel.INFO, True, id="same-level"),
+    ],
+)
+def test_is_enabled_for(level: LogLevel, check_level: LogLevel, expected: bool):
+    cfg = LoggingConfig()
+    cfg.level = level
+    configure_logging(cfg)
+
+    assert is_enabled_for(get_logger().bind(test=True), check_level) is expected
+
+
+def test_is_enabled_for_unsupported_logger():
+    # loggers without level checks are considered enabled
+    assert is_enabled_for(object(), LogLevel.DEBUG) is True
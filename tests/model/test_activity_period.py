@@ -5,6 +5,7 @@ from cr_kyoushi.simulation.model import (
     ComplexActivePeriod,
     SimpleActivePeriod,
     TimePeriod,
+    Weekday,
     WeekdayActivePeriod,
 )
 
@@ -173,3 +174,37 @@ def test_simple_not_on_weekday():
     # 2020.11.26 was a thursday
     check_datetime = datetime(2020, 11, 26, hour=3, minute=0)
     assert not active_period.in_active_period(check_datetime)
+
+
+def test_simple_uses_changed_week_days():
+    active_period = SimpleActivePeriod(week_days={"monday", "tuesday"})
+
+    # 2020.11.26 was a thursday
+    check_datetime = datetime(2020, 11, 26, hour=3, minute=0)
+    assert not active_period.in_active_period(check_datetime)
+
+    # changes to the model must be picked up
+    active_period.week_days.add(Weekday.THURSDAY)
+    assert active_period.in_active_period(check_datetime)
+
+    copied = active_period.copy(update={"week_days": {Weekday.MONDAY}})
+    assert not copied.in_active_period(check_datetime)
+
+
+def test_complex_uses_changed_week_days():
+    active_period = ComplexActivePeriod(
+        week_days={WeekdayActivePeriod(week_day="monday")}
+    )
+
+    # 2020.11.26 was a thursday
+    check_datetime = datetime(2020, 11, 26, hour=3, minute=0)
+    assert not active_period.in_active_period(check_datetime)
+
+    # changes to the model must be picked up
+    active_period.week_days.add(WeekdayActivePeriod(week_day="thursday"))
+    assert active_period.in_active_period(check_datetime)
+
+    copied = active_period.copy(
+        update={"week_days": {WeekdayActivePeriod(week_day="monday")}}
+    )
+    assert not copied.in_active_period(check_datetime)
@@ -33,3 +33,25 @@ def test_time_period_not_in_period_start_ge_end():
 
     assert not time_period.in_period(check_time_before)
     assert not time_period.in_period(check_time_after)
+
+
+def test_time_period_bounds_microsecond_precision():
+    time_period = TimePeriod(start_time="01:00", end_time="09:00")
+
+    assert not time_period.in_period(time(0, 59, 59, 999999))
+    assert time_period.in_period(time(1, 0, 0))
+    assert time_period.in_period(time(8, 59, 59, 999999))
+    assert not time_period.in_period(time(9, 0, 0))
+
+
+def test_time_period_uses_changed_times():
+    time_period = TimePeriod(start_time="01:00", end_time="09:00")
+    assert not time_period.in_period(time(10, 0, 0))
+
+    # changes to the model must be picked up
+    time_period.end_time = time(11, 0, 0)
+    assert time_period.in_period(time(10, 0, 0))
+
+    copied = time_period.copy(update={"start_time": time(10, 30, 0)})
+    assert not copied.in_period(time(10, 0, 0))
+    assert time_period.in_period(time(10, 0, 0))
@@ -61,3 +61,11 @@ def test_parse_from_invalid_string_value():
 def test_parse_from_enum():
     monday = WeekdayTestModel(weekday=Weekday.MONDAY)
     assert monday.weekday == Weekday.MONDAY
+
+
+def test_lookup_changes_do_not_affect_validation():
+    lookup = Weekday.lookup()
+    lookup.clear()
+
+    assert Weekday.lookup()["MONDAY"] == Weekday.MONDAY
+    assert WeekdayTestModel(weekday="monday").weekday == Weekday.MONDAY
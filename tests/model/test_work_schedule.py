@@ -102,6 +102,34 @@ def test_is_work_time(check_datetime, work_days, expected_result):
     assert schedule.is_work_time(check_datetime) is expected_result
 
 
+@pytest.mark.parametrize(
+    "check_datetime, work_days, expected_result",
+    [
+        pytest.param(datetime(2020, 12, 14, 12, 0, 0), {}, None, id="no-work-days"),
+        pytest.param(
+            datetime(2020, 12, 14, 13, 0, 0),  # is a monday
+            {
+                Weekday.MONDAY: WorkHours(start_time="12:00", end_time="13:00"),
+            },
+            None,
+            id="not-in-work-time",
+        ),
+        pytest.param(
+            datetime(2020, 12, 14, 12, 30, 0),  # is a monday
+            {
+                Weekday.MONDAY: WorkHours(start_time="12:00", end_time="13:00"),
+            },
+            (datetime(2020, 12, 14, 12, 0, 0), datetime(2020, 12, 14, 13, 0, 0)),
+            id="in-work-time",
+        ),
+    ],
+)
+def test_work_period(check_datetime, work_days, expected_result):
+    schedule = WorkSchedule(work_days=work_days)
+
+    assert schedule.work_period(check_datetime) == expected_result
+
+
 @pytest.mark.parametrize(
     "check_datetime, work_days, expected_result",
     [
@@ -130,6 +158,23 @@ def test_is_work_time(check_datetime, work_days, expected_result):
             datetime(2020, 12, 18, 12, 0, 0),
             id="currently-working",
         ),
+        pytest.param(
+            datetime(2020, 12, 18, 13, 0, 0),  # is a friday
+            {
+                Weekday.FRIDAY: WorkHours(start_time="12:00", end_time="13:00"),
+            },
+            datetime(2020, 12, 25, 12, 0, 0),  # the next friday
+            id="same-day-next-week",
+        ),
+        pytest.param(
+            datetime(2020, 12, 20, 12, 0, 0),  # is a sunday
+            {
+                Weekday.MONDAY: WorkHours(start_time="09:00", end_time="13:00"),
+                Weekday.FRIDAY: WorkHours(start_time="12:00", end_time="13:00"),
+            },
+            datetime(2020, 12, 21, 9, 0, 0),  # the next monday
+            id="next-week-wrap-around",
+        ),
     ],
 )
 def test_next_work_day(check_datetime, work_days, expected_result):
@@ -137,3 +182,20 @@ def test_next_work_day(check_datetime, work_days, expected_result):
 
     assert schedule.work_days == work_days
     assert schedule.next_work_start(check_datetime) == expected_result
+
+
+def test_next_work_day_uses_changed_work_days():
+    schedule = WorkSchedule(
+        work_days={Weekday.FRIDAY: WorkHours(start_time="12:00", end_time="13:00")}
+    )
+    check_datetime = datetime(2020, 12, 20, 12, 0, 0)  # is a sunday
+
+    assert schedule.next_work_start(check_datetime) == datetime(2020, 12, 25, 12, 0, 0)
+
+    # changes to the model must be picked up
+    schedule.work_days[Weekday.MONDAY] = WorkHours(start_time="09:00", end_time="13:00")
+    assert schedule.next_work_start(check_datetime) == datetime(2020, 12, 21, 9, 0, 0)
+
+    assert (
+        schedule.copy(update={"work_days": {}}).next_work_start(check_datetime) is None
+    )
@@ -152,3 +152,59 @@ def test_stop_on_end_state(three_sequential_states, mocker: MockFixture):
     assert exec_step_spy.call_count == 3
     assert sm.current_state is None
     assert sm._is_end_time() is False
+
+
+def test_no_end_time_skips_end_check(three_sequential_states, mocker: MockFixture):
+    sm = StartEndTimeStatemachine(
+        three_sequential_states[0].name,
+        states=three_sequential_states,
+    )
+
+    now_mock = mocker.patch("cr_kyoushi.simulation.sm.now")
+    exec_step_spy = mocker.spy(sm, "execute_step")
+
+    sm.run()
+
+    # the end time check (i.e., now()) is never needed
+    assert now_mock.call_count == 0
+    assert exec_step_spy.call_count == 3
+    assert sm.current_state is None
+
+
+def test_no_end_time_uses_overridden_end_check(
+    three_sequential_states, mocker: MockFixture
+):
+    class AlwaysEndStatemachine(StartEndTimeStatemachine):
+        def _is_end_time(self) -> bool:
+            return True
+
+    sm = AlwaysEndStatemachine(
+        three_sequential_states[0].name,
+        states=three_sequential_states,
+    )
+
+    exec_step_spy = mocker.spy(sm, "execute_step")
+
+    sm.run()
+
+    # the overridden check ends the machine before the first step
+    assert exec_step_spy.call_count == 0
+    assert sm.current_state == three_sequential_states[0].name
+
+
+def test_no_end_time_uses_instance_end_check(
+    three_sequential_states, mocker: MockFixture
+):
+    sm = StartEndTimeStatemachine(
+        three_sequential_states[0].name,
+        states=three_sequential_states,
+    )
+    sm._is_end_time = lambda: True
+
+    exec_step_spy = mocker.spy(sm, "execute_step")
+
+    sm.run()
+
+    # the instance level check ends the machine before the first step
+    assert exec_step_spy.call_count == 0
+    assert sm.current_state == three_sequential_states[0].name
@@ -7,7 +7,11 @@ import pytest
 
 from pytest_mock import MockFixture
 
-from cr_kyoushi.simulation.model import WorkSchedule
+from cr_kyoushi.simulation.model import (
+    Weekday,
+    WorkHours,
+    WorkSchedule,
+)
 from cr_kyoushi.simulation.sm import WorkHoursStatemachine
 
 
@@ -27,14 +31,40 @@ def test_in_work_hours_checks_correctly(result, mocker: MockFixture):
     mocker.patch("cr_kyoushi.simulation.sm.now", now_mock)
 
     schedule_mock = mocker.MagicMock(spec=WorkSchedule)
-    schedule_mock.is_work_time.return_value = result
+    schedule_mock.work_period.return_value = (
+        (current_time, current_time + timedelta(hours=1)) if result else None
+    )
 
     sm = WorkHoursStatemachine("mock", states=[], work_schedule=schedule_mock)
 
-    expected_calls = [call.is_work_time(current_time)]
+    expected_calls = [call.work_period(current_time)]
 
     assert sm._in_work_hours() is result
-    assert schedule_mock.is_work_time.mock_calls == expected_calls
+    assert schedule_mock.work_period.mock_calls == expected_calls
+
+
+def test_in_work_hours_reuses_work_period(mocker: MockFixture):
+    start = datetime(2020, 12, 14, 12, 0, 0)  # is a monday
+    schedule = WorkSchedule(
+        work_days={Weekday.MONDAY: WorkHours(start_time="12:00", end_time="13:00")}
+    )
+    work_period_spy = mocker.spy(WorkSchedule, "work_period")
+
+    now_mock = mocker.Mock()
+    mocker.patch("cr_kyoushi.simulation.sm.now", now_mock)
+
+    sm = WorkHoursStatemachine("mock", states=[], work_schedule=schedule)
+
+    # only the first check within the work period queries the schedule
+    for minutes in [0, 30, 59]:
+        now_mock.return_value = start + timedelta(minutes=minutes)
+        assert sm._in_work_hours() is True
+    assert work_period_spy.call_count == 1
+
+    # leaving the work period queries the schedule again
+    now_mock.return_value = start + timedelta(hours=1)
+    assert sm._in_work_hours() is False
+    assert work_period_spy.call_count == 2
 
 
 def test_wait_for_work_given_no_schedule_do_nothing(mocker: MockFixture):
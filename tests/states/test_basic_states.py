@@ -48,6 +48,16 @@ def test_transition_map_init(
     assert state.transitions_map == expected_dict
 
 
+def test_transitions_returns_copy(
+    noop_transitions: Tuple[Transition, Transition, Transition, Transition]
+):
+    state = StubState("stub", list(noop_transitions))
+
+    # changing the returned list must not change the state
+    state.transitions.clear()
+    assert state.transitions == list(noop_transitions)
+
+
 def test_non_unique_transitions_fail(
     noop_transitions: Tuple[Transition, Transition, Transition, Transition]
 ):
@@ -115,6 +125,21 @@ def test_round_robin_loops(noop_transitions):
     assert robin.next(log, empty_context) == t1
 
 
+def test_round_robin_reset(noop_transitions):
+    (t1, t2, t3, t4) = noop_transitions
+
+    robin = states.RoundRobinState("test", [t1, t2, t3, t4])
+    empty_context: Dict[str, Any] = {}
+
+    assert robin.next(log, empty_context) == t1
+    assert robin.next(log, empty_context) == t2
+
+    # after a reset the cycle starts at the first transition again
+    robin.reset()
+    assert robin.next(log, empty_context) == t1
+    assert robin.next(log, empty_context) == t2
+
+
 def test_round_robin_no_transitions():
     robin = states.RoundRobinState("test", [])
     empty_context: Dict[str, Any] = {}
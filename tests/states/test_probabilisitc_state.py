@@ -5,12 +5,12 @@ from typing import (
     Tuple,
 )
 
+import numpy as np
 import pytest
 
-from numpy import array as np_array
-from numpy import testing as np_testing
 from pytest_mock import MockFixture
 
+from cr_kyoushi.simulation import states
 from cr_kyoushi.simulation.logging import get_logger
 from cr_kyoushi.simulation.states import (
     AdaptiveProbabilisticState,
@@ -160,6 +160,27 @@ def test_next_probabilities(four_mocked_transitions: List[Transition]):
     assert observed_probabilities[t4_name] == weights[3]
 
 
+def test_next_selects_like_numpy_choice(four_mocked_transitions: List[Transition]):
+    weights = [0.3, 0.0, 0.6, 0.1]
+
+    state = ProbabilisticState(
+        name="test", transitions=four_mocked_transitions, weights=weights
+    )
+    empty_context: Dict[str, Any] = {}
+
+    # seeded simulations must select the same transitions as with np.random.choice
+    np.random.seed(4242)
+    expected = [
+        np.random.choice(a=np.array(four_mocked_transitions), p=weights)
+        for i in range(0, 1000)
+    ]
+
+    np.random.seed(4242)
+    observed = [state.next(log, context=empty_context) for i in range(0, 1000)]
+
+    assert observed == expected
+
+
 def test_equally_random_weights(four_mocked_transitions: List[Transition]):
     state = EquallyRandomState(name="test", transitions=four_mocked_transitions)
 
@@ -279,29 +300,24 @@ def test_adaptive_next_calls(
     # get spys and mock
     before_spy = mocker.spy(state, "adapt_before")
     after_spy = mocker.spy(state, "adapt_after")
-    np_mock = mocker.patch("cr_kyoushi.simulation.states.np.random.choice")
-    np_mock.return_value = selected = four_mocked_transitions[0]
+    random_mock = mocker.patch("cr_kyoushi.simulation.states.np.random.random_sample")
+    random_mock.return_value = 0.1
+    selected = four_mocked_transitions[0]
 
     # combine spys and mocks into one mock object
     # so we can check relative call order
     mock = mocker.Mock()
     mock.attach_mock(before_spy, "adapt_before")
     mock.attach_mock(after_spy, "adapt_after")
-    mock.attach_mock(np_mock, "choice")
-
-    state.next(log, empty_context)
-
-    # note that since all modifiers are 1 w=p is expected
-    calls = mock.mock_calls
-    # need to check manually since == does not work for np array args
-    assert len(calls) == 3
+    mock.attach_mock(random_mock, "random_sample")
 
-    assert calls[0] == call.adapt_before(log, empty_context)
-
-    np_testing.assert_array_equal(calls[1][2]["a"], np_array(four_mocked_transitions))
-    assert calls[1][2]["p"] == weights
+    assert state.next(log, empty_context) == selected
 
-    assert calls[2] == call.adapt_after(log, empty_context, selected)
+    assert mock.mock_calls == [
+        call.adapt_before(log, empty_context),
+        call.random_sample(),
+        call.adapt_after(log, empty_context, selected),
+    ]
 
 
 def test_adaptive_caluclates_and_returns_correctly(
@@ -325,21 +341,78 @@ def test_adaptive_caluclates_and_returns_correctly(
     calc_mock = mocker.patch("cr_kyoushi.simulation.states.calculate_propabilities")
     calc_mock.return_value = mock_p
 
-    np_mock = mocker.patch("cr_kyoushi.simulation.states.np.random.choice")
-    np_mock.return_value = selected = four_mocked_transitions[0]
+    # with the mocked probabilities the cumulative weights are [0.5, 0.75, 1, 1]
+    random_mock = mocker.patch("cr_kyoushi.simulation.states.np.random.random_sample")
+    random_mock.return_value = 0.6
 
-    # check returns chosen transition
-    assert state.next(log, empty_context) == selected
+    # check returns the transition chosen with the calculated probs
+    assert state.next(log, empty_context) == four_mocked_transitions[1]
 
     # check calc called correctly
     assert calc_mock.mock_calls == [call(weights, modifiers)]
-    # check choice called with calculated probs
-    calls = np_mock.call_args_list
+    assert random_mock.call_count == 1
+
+
+def test_adaptive_recalculates_only_on_modifier_change(
+    mocker: MockFixture,
+    four_mocked_transitions: List[Transition],
+):
+    weights = [0.25, 0.25, 0.25, 0.25]
+    empty_context: Dict[str, Any] = {}
+
+    class MockAdapt(AdaptiveProbabilisticState):
+        def adapt_after(self, log, context, selected):
+            # double the modifier of the selected transition in place
+            self._modifiers[selected] *= 2
+
+    state = MockAdapt(
+        name="test",
+        transitions=four_mocked_transitions,
+        weights=weights,
+    )
+    calc_spy = mocker.spy(states, "calculate_propabilities")
+
+    state.next(log, empty_context)
+    state.next(log, empty_context)
+    # every call changed the modifiers so each needs a new calculation
+    assert calc_spy.call_count == 2
+
+    # without any modifier changes the last calculation is reused
+    mocker.patch.object(MockAdapt, "adapt_after")
+    state.next(log, empty_context)
+    state.next(log, empty_context)
+    assert calc_spy.call_count == 3
+
+
+def test_adaptive_next_uses_overridden_probabilities(
+    four_mocked_transitions: List[Transition],
+):
+    empty_context: Dict[str, Any] = {}
+
+    class MockAdapt(AdaptiveProbabilisticState):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.selected_index = 0
+
+        def adapt_after(self, log, context, selected):
+            # select the next transition on the following call
+            # without changing the modifiers
+            self.selected_index = (self.selected_index + 1) % len(self.transitions)
+
+        @property
+        def probabilities(self) -> List[float]:
+            probabilities = [0.0] * len(self.transitions)
+            probabilities[self.selected_index] = 1.0
+            return probabilities
+
+    state = MockAdapt(
+        name="test",
+        transitions=four_mocked_transitions,
+        weights=[0.25, 0.25, 0.25, 0.25],
+    )
 
-    # need to check manually since == checks do not work for np array args
-    assert np_mock.call_count == 1
-    np_testing.assert_array_equal(calls[0][1]["a"], np_array(four_mocked_transitions))
-    assert calls[0][1]["p"] == mock_p
+    for i in range(8):
+        assert state.next(log, empty_context) is four_mocked_transitions[i % 4]
 
 
 def test_adaptive_reset(four_mocked_transitions: List[Transition]):
@@ -2,6 +2,7 @@ import time
 
 from cr_kyoushi.simulation import transitions
 from cr_kyoushi.simulation.logging import get_logger
+from cr_kyoushi.simulation.model import ApproximateFloat
 
 from ..fixtures.transitions import noop
 
@@ -16,8 +17,9 @@ def test_delayed_transition_init():
 
     assert transition.name == "test"
     assert transition.target is None
-    assert transition.delay_before == 2
-    assert transition.delay_after == 4
+    # plain numbers are converted to approximate floats
+    assert transition.delay_before == ApproximateFloat(min=2, max=2)
+    assert transition.delay_after == ApproximateFloat(min=4, max=4)
 
 
 def test_delayed_transition_delay_before():
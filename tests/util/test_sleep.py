@@ -31,6 +31,24 @@ def test_sleep_waits():
     assert abs(expected_wait - observed_wait) <= precission
 
 
+@pytest.mark.parametrize(
+    "sleep_time",
+    [
+        pytest.param(0, id="int"),
+        pytest.param(0.0, id="float"),
+        pytest.param(ApproximateFloat.convert(0.0), id="approximate"),
+    ],
+)
+def test_sleep_zero_returns_immediately(sleep_time, mocker: MockFixture):
+    sleep_mock = mocker.patch("cr_kyoushi.simulation.util.time.sleep")
+    skip_mock = mocker.patch("cr_kyoushi.simulation.util.skip_on_interrupt")
+
+    sleep(sleep_time)
+
+    assert sleep_mock.call_count == 0
+    assert skip_mock.call_count == 0
+
+
 def test_sleep_approximate_waits():
     precission = 0.01
     margin = 3